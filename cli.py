@@ -4,28 +4,28 @@ from __future__ import annotations
 
 import argparse
 import threading
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:  # pragma: no cover - typing helpers only
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
 from x_make_common_x.progress_snapshot import load_progress_snapshot
 from x_make_progress_board_x.progress_board_widget import run_progress_board
 
 
-def _current_stage_layout(snapshot_path: Path) -> list[tuple[str, str]]:
+def _current_stage_layout(snapshot_path: Path) -> Iterator[tuple[str, str]]:
+    """Yield (stage_id, title) pairs without materializing the full list."""
+
     snapshot = load_progress_snapshot(snapshot_path)
     if snapshot is None:
-        return []
-    stages: list[tuple[str, str]] = []
+        return
     for stage in snapshot.stages.values():
         stage_id = stage.stage_id.strip()
         if not stage_id:
             continue
-        title = stage.title.strip() or stage_id
-        stages.append((stage_id, title))
-    return stages
+        yield (stage_id, stage.title.strip() or stage_id)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -37,14 +37,19 @@ def main(argv: Sequence[str] | None = None) -> int:
     snapshot_arg = cast("str", args.snapshot)
 
     snapshot_path = Path(snapshot_arg).resolve()
-    definitions = _current_stage_layout(snapshot_path)
-    if not definitions:
+    layout = _current_stage_layout(snapshot_path)
+    first = next(layout, None)
+    definitions: Iterable[tuple[str, str]]
+    if first is None:
         print("No stages reported yet; using default template.")
+        definitions = [("environment", "Environment")]
+    else:
+        definitions = chain((first,), layout)
     worker_event = threading.Event()
     worker_event.set()
     run_progress_board(
         snapshot_path=snapshot_path,
-        stage_definitions=definitions or [("environment", "Environment")],
+        stage_definitions=definitions,
         worker_done_event=worker_event,
     )
     return 0
@@ -5,10 +5,11 @@ from __future__ import annotations
 import json
 import os
 import sys
-from collections.abc import Mapping, Sequence
+import time
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol, cast
+from typing import TYPE_CHECKING, ClassVar, NamedTuple, Protocol, TypeVar, cast
 
 if TYPE_CHECKING:  # pragma: no cover - typing helpers only
     import threading
@@ -25,20 +26,121 @@ except ModuleNotFoundError as exc:  # pragma: no cover - surfaced to caller
     message = "PySide6 is required to display the progress board."
     raise RuntimeError(message) from exc
 
+try:  # pragma: no cover - optional incremental JSON parser
+    import ijson
+except ModuleNotFoundError:  # pragma: no cover - streaming falls back to json
+    ijson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional fast JSON parser
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - parsing falls back to json
+    orjson = None  # type: ignore[assignment]
+
 Qt = QtCore.Qt
 QTimer = QtCore.QTimer
 Signal = QtCore.Signal
 _DONE_STATUSES = {"completed", "attention", "blocked"}
-_POLL_INTERVAL_MS = 500
+_STATUS_TO_CHECK: dict[str, Qt.CheckState] = {
+    "completed": Qt.CheckState.Checked,
+    "attention": Qt.CheckState.Checked,
+    "blocked": Qt.CheckState.Checked,
+    "running": Qt.CheckState.PartiallyChecked,
+    "pending": Qt.CheckState.Unchecked,
+}
+_FALLBACK_POLL_INTERVAL_MS = 5000
+_REFRESH_DEBOUNCE_MS = 150
 _AUTO_CLOSE_DELAY_MS = 750
+_JSON_CACHE_MAX_ENTRIES = 32
+_REPO_RECHECK_INTERVAL_NS = 1_000_000_000
+
+_CacheKeyT = TypeVar("_CacheKeyT")
+_CacheValueT = TypeVar("_CacheValueT")
+
+
+def _bounded_cache_store(
+    cache: dict[_CacheKeyT, _CacheValueT],
+    key: _CacheKeyT,
+    value: _CacheValueT,
+) -> None:
+    if len(cache) >= _JSON_CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+def _read_json_payload(path: Path) -> dict[str, object] | None:
+    try:
+        raw_bytes = path.read_bytes()
+        if orjson is not None:
+            raw_payload = cast("object", orjson.loads(raw_bytes))
+        else:
+            raw_payload = cast("object", json.loads(raw_bytes))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw_payload, Mapping):
+        return None
+    mapping_payload = cast("Mapping[object, object]", raw_payload)
+    normalized_payload: dict[str, object] = {
+        str(key): value for key, value in mapping_payload.items()
+    }
+    return normalized_payload
+
+
+def _scan_mtimes_ns(paths: Iterable[Path]) -> dict[str, int]:
+    """Collect st_mtime_ns for *paths* with one scandir per parent directory."""
+
+    grouped: dict[str, dict[str, Path]] = {}
+    for path in paths:
+        grouped.setdefault(os.fspath(path.parent), {})[path.name] = path
+    mtimes: dict[str, int] = {}
+    for parent, names in grouped.items():
+        try:
+            with os.scandir(parent) as scan:
+                for dir_entry in scan:
+                    target = names.get(dir_entry.name)
+                    if target is None:
+                        continue
+                    try:
+                        stat_result = dir_entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    mtimes[os.fspath(target)] = stat_result.st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+def _iter_repo_index_events(path: Path) -> Iterator[tuple[str, object]]:
+    """Yield ("entries_dir", str) and ("entry", mapping) events one at a time.
+
+    Requires :mod:`ijson`; only one entry mapping is held in memory at any
+    point instead of the fully materialized payload.
+    """
+
+    with path.open("rb") as handle:
+        builder = None
+        events = ijson.parse(handle)
+        first = next(events, None)
+        if first is None or first[0] != "" or first[1] != "start_map":
+            message = "repo index payload is not a JSON object"
+            raise ijson.JSONError(message)
+        for prefix, event, value in events:
+            if prefix == "entries_dir" and event == "string":
+                yield ("entries_dir", value)
+            elif prefix == "entries.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif builder is not None:
+                builder.event(event, value)
+                if prefix == "entries.item" and event == "end_map":
+                    yield ("entry", builder.value)
+                    builder = None
 
 
 class _CloseEvent(Protocol):
     """Marker protocol for Qt close events."""
 
 
-@dataclass(slots=True)
-class _RepoEntry:
+class _RepoEntry(NamedTuple):
     repo_id: str
     display_name: str
     status: str
@@ -52,6 +154,510 @@ class _RepoIndexCacheEntry:
     path: Path
     mtime: float | None
     entries: list[_RepoEntry]
+    last_checked_ns: int
+
+
+_DETAIL_HEADERS = ("Repository", "Status", "Updated", "Messages")
+
+_ModelIndex = QtCore.QModelIndex | QtCore.QPersistentModelIndex
+
+
+class _RepoTableModel(QtCore.QAbstractTableModel):
+    """Read-only model serving cell text straight from _RepoEntry tuples.
+
+    No per-cell item objects are owned by Qt; data is produced on demand
+    for visible cells only, so refreshing N rows is a single model reset
+    instead of N x 4 Shiboken-owned allocations.
+    """
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._entries: list[_RepoEntry] = []
+
+    def set_entries(self, entries: list[_RepoEntry]) -> None:
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    def rowCount(  # noqa: N802 - Qt signature
+        self,
+        parent: _ModelIndex = QtCore.QModelIndex(),
+    ) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def columnCount(  # noqa: N802 - Qt signature
+        self,
+        parent: _ModelIndex = QtCore.QModelIndex(),
+    ) -> int:
+        if parent.isValid():
+            return 0
+        return len(_DETAIL_HEADERS)
+
+    def data(
+        self,
+        index: _ModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if not index.isValid() or not 0 <= index.row() < len(self._entries):
+            return None
+        entry = self._entries[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return entry.display_name or entry.repo_id or "<repo>"
+            if column == 1:
+                return entry.status
+            if column == 2:
+                return entry.updated_at
+            if column == 3:
+                return " | ".join(msg for msg in entry.messages if msg)
+        elif role == Qt.ItemDataRole.ToolTipRole and column == 3:
+            return entry.detail_path
+        return None
+
+    def headerData(  # noqa: N802 - Qt signature
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> object:
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+            and 0 <= section < len(_DETAIL_HEADERS)
+        ):
+            return _DETAIL_HEADERS[section]
+        return None
+
+
+class _SnapshotLoaderWorker(QtCore.QObject):
+    """Loads snapshot and repo-index payloads off the GUI thread.
+
+    Lives on a dedicated :class:`~PySide6.QtCore.QThread`; the widget
+    requests reloads via a queued signal and receives parsed results
+    through :attr:`snapshot_ready`, so file I/O and JSON decoding never
+    block repaints.
+    """
+
+    snapshot_ready = Signal(object, object)
+
+    def __init__(self, snapshot_path: Path) -> None:
+        super().__init__()
+        self._snapshot_path = snapshot_path
+        self._snapshot_sig: tuple[int, int] | None = None
+        self._last_snapshot: ProgressSnapshot | None = None
+        self._repo_index_cache: dict[str, _RepoIndexCacheEntry] = {}
+        # Only ever touched from this worker's thread, so no locking needed.
+        self._json_cache: dict[tuple[str, int], dict[str, object] | None] = {}
+        self._snapshot_cache: dict[int, ProgressSnapshot | None] = {}
+
+    @QtCore.Slot()
+    def invalidate(self) -> None:
+        """Force the next reload to emit even if the snapshot is unchanged."""
+
+        self._snapshot_sig = None
+
+    @QtCore.Slot(str)
+    def invalidate_repo_index(self, path_str: str) -> None:
+        """Force the next reload to restat the index at *path_str*."""
+
+        for cache_entry in self._repo_index_cache.values():
+            if os.fspath(cache_entry.path) == path_str:
+                cache_entry.last_checked_ns = 0
+
+    @QtCore.Slot()
+    def reload(self) -> None:
+        stat_result = self._safe_stat(self._snapshot_path)
+        if stat_result is not None:
+            signature = (stat_result.st_mtime_ns, stat_result.st_size)
+            if signature == self._snapshot_sig:
+                # The snapshot is quiescent but a repo-index file may still
+                # have changed; the recheck throttle keeps this cheap.
+                snapshot = self._last_snapshot
+                if snapshot is not None and self._refresh_stage_repo_details(
+                    snapshot.stages
+                ):
+                    self.snapshot_ready.emit(snapshot, dict(self._repo_index_cache))
+                return
+            self._snapshot_sig = signature
+        else:
+            self._snapshot_sig = None
+
+        mtime_ns = stat_result.st_mtime_ns if stat_result is not None else None
+        snapshot = self._load_snapshot_cached(mtime_ns)
+        self._last_snapshot = snapshot
+        if snapshot is None:
+            self.snapshot_ready.emit(None, {})
+            return
+
+        self._refresh_stage_repo_details(snapshot.stages)
+        self.snapshot_ready.emit(snapshot, dict(self._repo_index_cache))
+
+    def _refresh_stage_repo_details(
+        self,
+        stages: Mapping[str, ProgressStage],
+    ) -> bool:
+        """Update the repo-index cache; return True when anything changed."""
+
+        changed = False
+        observed_ids: set[str] = set()
+        pending: dict[str, Path] = {}
+        now_ns = time.monotonic_ns()
+        for stage_id, stage in stages.items():
+            observed_ids.add(stage_id)
+            index_path = self._index_path_from_metadata(stage.metadata)
+            if index_path is None:
+                if self._repo_index_cache.pop(stage_id, None) is not None:
+                    changed = True
+                continue
+            cached = self._repo_index_cache.get(stage_id)
+            if (
+                cached is not None
+                and cached.path == index_path
+                and now_ns - cached.last_checked_ns < _REPO_RECHECK_INTERVAL_NS
+            ):
+                continue
+            pending[stage_id] = index_path
+
+        if pending:
+            mtimes = _scan_mtimes_ns(pending.values())
+            for stage_id, index_path in pending.items():
+                cache_entry = self._load_repo_index_payload(
+                    stage_id,
+                    index_path,
+                    mtimes.get(os.fspath(index_path)),
+                    now_ns,
+                )
+                if cache_entry is None:
+                    if self._repo_index_cache.pop(stage_id, None) is not None:
+                        changed = True
+                elif self._repo_index_cache.get(stage_id) is not cache_entry:
+                    self._repo_index_cache[stage_id] = cache_entry
+                    changed = True
+
+        return self._prune_stale_repo_cache(observed_ids) or changed
+
+    def _cached_json(self, path_str: str, mtime_ns: int) -> dict[str, object] | None:
+        """Parse *path_str* once per (path, mtime_ns) and reuse the payload."""
+
+        key = (path_str, mtime_ns)
+        if key in self._json_cache:
+            return self._json_cache[key]
+        payload = _read_json_payload(Path(path_str))
+        _bounded_cache_store(self._json_cache, key, payload)
+        return payload
+
+    def _load_snapshot_cached(self, mtime_ns: int | None) -> ProgressSnapshot | None:
+        if mtime_ns is None:
+            return load_progress_snapshot(self._snapshot_path)
+        if mtime_ns in self._snapshot_cache:
+            return self._snapshot_cache[mtime_ns]
+        snapshot = load_progress_snapshot(self._snapshot_path)
+        _bounded_cache_store(self._snapshot_cache, mtime_ns, snapshot)
+        return snapshot
+
+    def _evict_cached_json(self, path_str: str) -> None:
+        for key in [key for key in self._json_cache if key[0] == path_str]:
+            self._json_cache.pop(key, None)
+
+    @staticmethod
+    def _index_path_from_metadata(
+        metadata: Mapping[str, object] | None,
+    ) -> Path | None:
+        if metadata is None:
+            return None
+        for key, value in metadata.items():
+            if str(key) == "repo_progress_index_path" and value:
+                return Path(str(value))
+        return None
+
+    @staticmethod
+    def _normalized_messages(messages_raw: object) -> tuple[str, ...]:
+        if isinstance(messages_raw, Sequence) and not isinstance(
+            messages_raw, (str, bytes, bytearray)
+        ):
+            normalized: list[str] = []
+            for msg in messages_raw:
+                text = str(msg).strip()
+                if text:
+                    normalized.append(text)
+            return tuple(normalized)
+        if isinstance(messages_raw, str):
+            text = messages_raw.strip()
+            if text:
+                return (text,)
+        return ()
+
+    def _normalize_repo_entry(
+        self,
+        entry: Mapping[str, object],
+        entries_dir_resolved: str | None,
+    ) -> _RepoEntry | None:
+        """Normalize one raw entry mapping.
+
+        When *entries_dir_resolved* is None the raw relative detail path is
+        kept as-is for the caller to join once the directory is known.
+        """
+
+        repo_id = str(entry.get("repo_id") or "")
+        display = str(entry.get("display_name") or repo_id or "<repo>")
+        status = str(entry.get("status") or "pending")
+        updated_at = str(entry.get("updated_at") or "")
+        message_preview = self._normalized_messages(entry.get("message_preview"))
+        detail_path_obj = entry.get("detail_path")
+        detail_path: str | None = None
+        if isinstance(detail_path_obj, str) and detail_path_obj:
+            if entries_dir_resolved is None:
+                detail_path = detail_path_obj
+            else:
+                detail_path = os.path.normpath(
+                    os.path.join(entries_dir_resolved, detail_path_obj)
+                )
+        return _RepoEntry(
+            repo_id=repo_id,
+            display_name=display,
+            status=status,
+            updated_at=updated_at,
+            messages=message_preview,
+            detail_path=detail_path,
+        )
+
+    def _normalize_repo_entries(
+        self,
+        entries_payload: object,
+        entries_dir: Path,
+    ) -> list[_RepoEntry]:
+        normalized_entries: list[_RepoEntry] = []
+        if isinstance(entries_payload, Sequence) and not isinstance(
+            entries_payload, (str, bytes, bytearray)
+        ):
+            entries_dir_resolved = str(entries_dir.resolve())
+            for entry in entries_payload:
+                if isinstance(entry, Mapping):
+                    normalized_entry = self._normalize_repo_entry(
+                        entry, entries_dir_resolved
+                    )
+                    if normalized_entry is not None:
+                        normalized_entries.append(normalized_entry)
+        return normalized_entries
+
+    @staticmethod
+    def _safe_stat(path: Path) -> os.stat_result | None:
+        try:
+            return path.stat()
+        except OSError:
+            return None
+
+    def _load_repo_index_payload(
+        self,
+        stage_id: str,
+        index_path: Path,
+        mtime_ns: int | None,
+        now_ns: int,
+    ) -> _RepoIndexCacheEntry | None:
+        if mtime_ns is None:
+            return None
+        cached = self._repo_index_cache.get(stage_id)
+        mtime: float | None = mtime_ns / 1_000_000_000
+        if cached is not None and cached.path == index_path and cached.mtime == mtime:
+            cached.last_checked_ns = now_ns
+            return cached
+        entries = self._normalize_streamed_repo_index(index_path)
+        if entries is None:
+            payload = self._cached_json(str(index_path), mtime_ns)
+            if payload is None:
+                return None
+            entries_dir = index_path.parent
+            if "entries_dir" in payload:
+                entries_dir_raw = payload["entries_dir"]
+                if isinstance(entries_dir_raw, str):
+                    entries_dir_candidate = entries_dir_raw.strip()
+                    if entries_dir_candidate:
+                        entries_dir = Path(entries_dir_candidate)
+            entries_payload: object = payload.get("entries", None)
+            entries = self._normalize_repo_entries(entries_payload, entries_dir)
+        return _RepoIndexCacheEntry(
+            path=index_path,
+            mtime=mtime,
+            entries=entries,
+            last_checked_ns=now_ns,
+        )
+
+    def _normalize_streamed_repo_index(
+        self,
+        index_path: Path,
+    ) -> list[_RepoEntry] | None:
+        """Normalize entries incrementally when :mod:`ijson` is installed.
+
+        Detail paths are joined only after the stream ends so the result
+        does not depend on whether "entries_dir" precedes "entries" in the
+        document, matching the fully-materialized fallback.
+        """
+
+        if ijson is None:
+            return None
+        entries_dir = index_path.parent
+        normalized_entries: list[_RepoEntry] = []
+        try:
+            for kind, value in _iter_repo_index_events(index_path):
+                if kind == "entries_dir":
+                    entries_dir_candidate = str(value).strip()
+                    if entries_dir_candidate:
+                        entries_dir = Path(entries_dir_candidate)
+                elif isinstance(value, Mapping):
+                    entry_payload = cast("Mapping[str, object]", value)
+                    normalized_entry = self._normalize_repo_entry(entry_payload, None)
+                    if normalized_entry is not None:
+                        normalized_entries.append(normalized_entry)
+        except (OSError, ijson.JSONError):
+            return None
+        entries_dir_resolved = str(entries_dir.resolve())
+        return [
+            entry
+            if entry.detail_path is None
+            else entry._replace(
+                detail_path=os.path.normpath(
+                    os.path.join(entries_dir_resolved, entry.detail_path)
+                )
+            )
+            for entry in normalized_entries
+        ]
+
+    def _prune_stale_repo_cache(self, observed_ids: set[str]) -> bool:
+        stale_keys = [
+            stage_id
+            for stage_id in list(self._repo_index_cache)
+            if stage_id not in observed_ids
+        ]
+        for stage_id in stale_keys:
+            stale_entry = self._repo_index_cache.pop(stage_id, None)
+            if stale_entry is not None:
+                self._evict_cached_json(str(stale_entry.path))
+        return bool(stale_keys)
+
+
+class _SharedSnapshotWatcher(QtCore.QObject):
+    """One watcher plus loader thread per snapshot path, shared by boards.
+
+    Every :class:`ProgressBoardWidget` observing the same path subscribes
+    to :attr:`snapshot_ready`, so a change is parsed once regardless of
+    how many boards are open in the process.
+    """
+
+    snapshot_ready = Signal(object, object)
+    _reload_requested = Signal()
+    _invalidate_requested = Signal()
+    _index_invalidate_requested = Signal(str)
+
+    _instances: ClassVar[dict[str, _SharedSnapshotWatcher]] = {}
+
+    @classmethod
+    def for_path(cls, snapshot_path: Path) -> _SharedSnapshotWatcher:
+        key = os.fspath(snapshot_path)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(snapshot_path)
+            cls._instances[key] = instance
+        return instance
+
+    def __init__(self, snapshot_path: Path) -> None:
+        super().__init__()
+        self._snapshot_path = snapshot_path
+        self._pending_reload = False
+        self._subscriber_count = 0
+        self._watched_index_paths: set[str] = set()
+
+        self._loader = _SnapshotLoaderWorker(snapshot_path)
+        self._loader_thread = QtCore.QThread(self)
+        self._loader.moveToThread(self._loader_thread)
+        self._reload_requested.connect(self._loader.reload)
+        self._invalidate_requested.connect(self._loader.invalidate)
+        self._index_invalidate_requested.connect(self._loader.invalidate_repo_index)
+        self._loader.snapshot_ready.connect(self.snapshot_ready)
+        self._loader.snapshot_ready.connect(self._sync_index_watches)
+        self._loader_thread.start()
+
+        watcher = QtCore.QFileSystemWatcher(self)
+        watcher.fileChanged.connect(self._handle_snapshot_file_changed)
+        watcher.directoryChanged.connect(self._handle_snapshot_dir_changed)
+        watcher.addPath(str(self._snapshot_path.parent))
+        if self._snapshot_path.exists():
+            watcher.addPath(str(self._snapshot_path))
+        self._watcher = watcher
+
+        # Central widgets never receive close events, so detach() alone
+        # cannot be relied on to stop the loader thread before exit.
+        app = QtCore.QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._shutdown)
+
+    def attach(self) -> None:
+        self._subscriber_count += 1
+        self._invalidate_requested.emit()
+        self.request_refresh()
+
+    def detach(self) -> None:
+        self._subscriber_count -= 1
+        if self._subscriber_count <= 0:
+            self._shutdown()
+
+    def request_refresh(self) -> None:
+        """Coalesce refresh triggers into one reload per debounce window."""
+
+        if self._pending_reload:
+            return
+        self._pending_reload = True
+        QTimer.singleShot(_REFRESH_DEBOUNCE_MS, self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        self._pending_reload = False
+        self._reload_requested.emit()
+
+    def _handle_snapshot_file_changed(self, path: str) -> None:
+        self._rearm_snapshot_watch()
+        self._rearm_index_watches()
+        if path in self._watched_index_paths:
+            # Skip the worker's recheck throttle for this index so the
+            # event is not absorbed until the fallback poll.
+            self._index_invalidate_requested.emit(path)
+        self.request_refresh()
+
+    def _handle_snapshot_dir_changed(self, _path: str) -> None:
+        self._rearm_snapshot_watch()
+        self._rearm_index_watches()
+        self.request_refresh()
+
+    def _rearm_snapshot_watch(self) -> None:
+        snapshot_str = str(self._snapshot_path)
+        if snapshot_str not in self._watcher.files() and self._snapshot_path.exists():
+            self._watcher.addPath(snapshot_str)
+
+    def _sync_index_watches(self, _snapshot: object, repo_cache: object) -> None:
+        """Keep the filesystem watcher aligned with the cached index paths."""
+
+        cache = cast("dict[str, _RepoIndexCacheEntry]", repo_cache)
+        desired = {str(entry.path) for entry in cache.values()}
+        stale = self._watched_index_paths - desired
+        if stale:
+            self._watcher.removePaths(sorted(stale))
+        self._watched_index_paths = desired
+        self._rearm_index_watches()
+
+    def _rearm_index_watches(self) -> None:
+        if not self._watched_index_paths:
+            return
+        watched = set(self._watcher.files())
+        for path_str in self._watched_index_paths - watched:
+            if os.path.exists(path_str):
+                self._watcher.addPath(path_str)
+
+    def _shutdown(self) -> None:
+        self._instances.pop(os.fspath(self._snapshot_path), None)
+        if self._loader_thread.isRunning():
+            self._loader_thread.quit()
+            self._loader_thread.wait(2000)
 
 
 class ProgressBoardWidget(QtWidgets.QWidget):
@@ -63,7 +669,7 @@ class ProgressBoardWidget(QtWidgets.QWidget):
         self,
         *,
         snapshot_path: Path,
-        stage_definitions: Sequence[tuple[str, str]],
+        stage_definitions: Iterable[tuple[str, str]],
         worker_done_event: threading.Event,
         parent: QtWidgets.QWidget | None = None,
     ) -> None:
@@ -71,24 +677,34 @@ class ProgressBoardWidget(QtWidgets.QWidget):
         self._snapshot_path = Path(os.fspath(snapshot_path))
         self._worker_done_event = worker_done_event
         self._stage_definitions: list[tuple[str, str]] = []
+        self._stage_index: dict[str, int] = {}
         for stage_id, title in stage_definitions:
             self._record_stage_definition(str(stage_id), str(title))
 
         self._items: dict[str, QtWidgets.QListWidgetItem] = {}
+        self._row_to_stage: dict[int, str] = {}
         self._repo_index_cache: dict[str, _RepoIndexCacheEntry] = {}
+        self._last_rendered_key: tuple[str, float | None] | None = None
         self._selected_stage_id: str | None = None
         self._completion_triggered = False
 
         self._status_label: QtWidgets.QLabel
         self._checklist: QtWidgets.QListWidget
-        self._detail_table: QtWidgets.QTableWidget
+        self._detail_stack: QtWidgets.QStackedWidget
+        self._detail_view: QtWidgets.QTableView | None = None
+        self._detail_model: _RepoTableModel | None = None
 
         self._build_ui()
 
+        self._shared_watcher = _SharedSnapshotWatcher.for_path(self._snapshot_path)
+        self._shared_watcher.snapshot_ready.connect(self._handle_snapshot_ready)
+        self._shared_watcher.attach()
+
         self._timer: QtCore.QTimer = QTimer(self)
-        self._timer.setInterval(_POLL_INTERVAL_MS)
-        self._timer.timeout.connect(self._refresh_snapshot)
+        self._timer.setInterval(_FALLBACK_POLL_INTERVAL_MS)
+        self._timer.timeout.connect(self._request_refresh)
         self._timer.start()
+        self._request_refresh()
 
     def _build_ui(self) -> None:
         layout = QtWidgets.QVBoxLayout(self)
@@ -127,23 +743,12 @@ class ProgressBoardWidget(QtWidgets.QWidget):
         )
         detail_layout.addWidget(detail_label)
 
-        detail_table = QtWidgets.QTableWidget(parent=detail_container)
-        detail_table.setColumnCount(4)
-        detail_table.setHorizontalHeaderLabels(
-            ["Repository", "Status", "Updated", "Messages"]
-        )
-        detail_table.horizontalHeader().setStretchLastSection(True)
-        detail_table.setEditTriggers(
-            QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers
-        )
-        detail_table.setSelectionBehavior(
-            QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows
-        )
-        detail_table.setSelectionMode(
-            QtWidgets.QAbstractItemView.SelectionMode.NoSelection
-        )
-        detail_layout.addWidget(detail_table)
-        self._detail_table = detail_table
+        detail_stack = QtWidgets.QStackedWidget(detail_container)
+        placeholder = QtWidgets.QLabel("No repository details reported yet.")
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        detail_stack.addWidget(placeholder)
+        detail_layout.addWidget(detail_stack)
+        self._detail_stack = detail_stack
 
         splitter.addWidget(detail_container)
         splitter.setStretchFactor(0, 1)
@@ -157,13 +762,14 @@ class ProgressBoardWidget(QtWidgets.QWidget):
             first_item = self._checklist.item(0)
             if first_item is not None:
                 self._checklist.setCurrentItem(first_item)
-                self._selected_stage_id = str(first_item.data(Qt.ItemDataRole.UserRole))
+                self._selected_stage_id = self._row_to_stage.get(0)
 
     def _record_stage_definition(self, stage_id: str, title: str) -> None:
-        for index, (existing_id, _) in enumerate(self._stage_definitions):
-            if existing_id == stage_id:
-                self._stage_definitions[index] = (stage_id, title)
-                return
+        index = self._stage_index.get(stage_id)
+        if index is not None:
+            self._stage_definitions[index] = (stage_id, title)
+            return
+        self._stage_index[stage_id] = len(self._stage_definitions)
         self._stage_definitions.append((stage_id, title))
 
     def _ensure_stage_item(
@@ -180,22 +786,31 @@ class ProgressBoardWidget(QtWidgets.QWidget):
         item.setCheckState(Qt.CheckState.Unchecked)
         self._checklist.addItem(item)
         self._items[stage_id] = item
+        self._row_to_stage[self._checklist.count() - 1] = stage_id
         return item
 
-    def _refresh_snapshot(self) -> None:
-        snapshot = load_progress_snapshot(self._snapshot_path)
+    def _request_refresh(self) -> None:
+        self._shared_watcher.request_refresh()
+        self._check_worker_done()
+
+    def _handle_snapshot_ready(self, snapshot: object, repo_cache: object) -> None:
+        self._repo_index_cache = cast("dict[str, _RepoIndexCacheEntry]", repo_cache)
         if snapshot is None:
             if not self._completion_triggered:
                 self._status_label.setText("Waiting for progress snapshot feed...")
+            self._check_worker_done()
             return
 
-        self._update_from_snapshot(snapshot)
+        self._update_from_snapshot(cast("ProgressSnapshot", snapshot))
+        self._check_worker_done()
+
+    def _check_worker_done(self) -> None:
         if self._worker_done_event.is_set() and not self._completion_triggered:
             self._status_label.setText("Tooling finished. Command center unlocking...")
             self._handle_completion()
 
     def _update_from_snapshot(self, snapshot: ProgressSnapshot) -> None:
-        stages: dict[str, ProgressStage] = dict(snapshot.stages)
+        stages: Mapping[str, ProgressStage] = snapshot.stages
         for stage_id, stage in stages.items():
             self._record_stage_definition(stage_id, stage.title)
             self._ensure_stage_item(stage_id, stage.title)
@@ -214,7 +829,6 @@ class ProgressBoardWidget(QtWidgets.QWidget):
             if not self._apply_stage_state(item, title, status, messages):
                 all_done = False
 
-        self._refresh_stage_repo_details(stages)
         self._update_detail_view(self._current_stage_id())
 
         if stages and not self._completion_triggered:
@@ -236,7 +850,7 @@ class ProgressBoardWidget(QtWidgets.QWidget):
         message_suffix = self._message_suffix(messages)
         item.setText(f"{title} - {status_text}{message_suffix}")
 
-        normalized_status = status_text.lower()
+        normalized_status = status_text.strip().lower()
         item.setCheckState(self._check_state_for_status(normalized_status))
         return normalized_status in _DONE_STATUSES
 
@@ -246,52 +860,49 @@ class ProgressBoardWidget(QtWidgets.QWidget):
         self._update_detail_view(stage_id)
 
     def _current_stage_id(self) -> str | None:
-        selected = self._checklist.selectedItems()
-        if not selected:
-            return None
-        return str(selected[0].data(Qt.ItemDataRole.UserRole))
-
-    def _refresh_stage_repo_details(
-        self,
-        stages: Mapping[str, ProgressStage],
-    ) -> None:
-        observed_ids: set[str] = set()
-        for stage_id, stage in stages.items():
-            observed_ids.add(stage_id)
-            cache_entry = self._load_repo_index_payload(stage_id, stage.metadata)
-            if cache_entry is None:
-                self._repo_index_cache.pop(stage_id, None)
-            else:
-                self._repo_index_cache[stage_id] = cache_entry
-
-        self._prune_stale_repo_cache(observed_ids)
+        return self._row_to_stage.get(self._checklist.currentRow())
+
+    def _ensure_detail_view(self) -> tuple[QtWidgets.QTableView, _RepoTableModel]:
+        """Create the detail view on first use; most sessions never need it."""
+
+        view = self._detail_view
+        model = self._detail_model
+        if view is not None and model is not None:
+            return view, model
+        model = _RepoTableModel(self)
+        view = QtWidgets.QTableView(parent=self._detail_stack)
+        view.setModel(model)
+        view.horizontalHeader().setStretchLastSection(True)
+        view.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        view.setSelectionBehavior(
+            QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        view.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
+        self._detail_stack.addWidget(view)
+        self._detail_view = view
+        self._detail_model = model
+        return view, model
 
     def _update_detail_view(self, stage_id: str | None) -> None:
-        table = self._detail_table
-        if stage_id is None:
-            table.setRowCount(0)
+        cache_entry = (
+            self._repo_index_cache.get(stage_id) if stage_id is not None else None
+        )
+        if stage_id is None or cache_entry is None:
+            self._last_rendered_key = None
+            if self._detail_model is not None:
+                self._detail_model.set_entries([])
+                self._detail_stack.setCurrentIndex(0)
             return
 
-        cache_entry = self._repo_index_cache.get(stage_id)
-        if cache_entry is None:
-            table.setRowCount(0)
+        rendered_key = (stage_id, cache_entry.mtime)
+        if rendered_key == self._last_rendered_key:
             return
 
-        entries = cache_entry.entries
-        table.setRowCount(len(entries))
-        for row, entry in enumerate(entries):
-            display = entry.display_name or entry.repo_id or "<repo>"
-            message_text = " | ".join(msg for msg in entry.messages if msg)
-
-            table.setItem(row, 0, QtWidgets.QTableWidgetItem(display))
-            table.setItem(row, 1, QtWidgets.QTableWidgetItem(entry.status))
-            table.setItem(row, 2, QtWidgets.QTableWidgetItem(entry.updated_at))
-            message_item = QtWidgets.QTableWidgetItem(message_text)
-            if entry.detail_path is not None:
-                message_item.setData(Qt.ItemDataRole.ToolTipRole, entry.detail_path)
-            table.setItem(row, 3, message_item)
-
-        table.resizeRowsToContents()
+        view, model = self._ensure_detail_view()
+        model.set_entries(cache_entry.entries)
+        self._last_rendered_key = rendered_key
+        self._detail_stack.setCurrentWidget(view)
+        QTimer.singleShot(0, view.resizeRowsToContents)
 
     def _handle_completion(self) -> None:
         if self._completion_triggered:
@@ -302,153 +913,29 @@ class ProgressBoardWidget(QtWidgets.QWidget):
 
     def closeEvent(self, event: _CloseEvent) -> None:  # noqa: N802 - Qt signature
         self._timer.stop()
+        self._shared_watcher.snapshot_ready.disconnect(self._handle_snapshot_ready)
+        self._shared_watcher.detach()
         super().closeEvent(event)
 
     @staticmethod
     def _message_suffix(messages: Sequence[str]) -> str:
-        for message in reversed(tuple(messages)):
-            text = str(message).strip()
+        for index in range(len(messages) - 1, -1, -1):
+            text = str(messages[index]).strip()
             if text:
                 return f" ({text})"
         return ""
 
     @staticmethod
-    def _check_state_for_status(status: str) -> int:
-        normalized = status.lower().strip()
-        if normalized in _DONE_STATUSES:
-            return Qt.CheckState.Checked
-        if normalized == "running":
-            return Qt.CheckState.PartiallyChecked
-        if normalized == "pending":
-            return Qt.CheckState.Unchecked
-        return Qt.CheckState.PartiallyChecked
-
-    @staticmethod
-    def _normalized_messages(messages_raw: object) -> tuple[str, ...]:
-        if isinstance(messages_raw, Sequence) and not isinstance(
-            messages_raw, (str, bytes, bytearray)
-        ):
-            normalized: list[str] = []
-            for msg in messages_raw:
-                text = str(msg).strip()
-                if text:
-                    normalized.append(text)
-            return tuple(normalized)
-        if isinstance(messages_raw, str):
-            text = messages_raw.strip()
-            if text:
-                return (text,)
-        return ()
-
-    def _normalize_repo_entry(
-        self,
-        entry: Mapping[str, object],
-        entries_dir: Path,
-    ) -> _RepoEntry | None:
-        repo_id = str(entry.get("repo_id") or "")
-        display = str(entry.get("display_name") or repo_id or "<repo>")
-        status = str(entry.get("status") or "pending")
-        updated_at = str(entry.get("updated_at") or "")
-        message_preview = self._normalized_messages(entry.get("message_preview"))
-        detail_path_obj = entry.get("detail_path")
-        detail_path: str | None = None
-        if isinstance(detail_path_obj, str) and detail_path_obj:
-            detail_path = str((entries_dir / detail_path_obj).resolve())
-        return _RepoEntry(
-            repo_id=repo_id,
-            display_name=display,
-            status=status,
-            updated_at=updated_at,
-            messages=message_preview,
-            detail_path=detail_path,
+    def _check_state_for_status(status: str) -> Qt.CheckState:
+        return _STATUS_TO_CHECK.get(
+            status.strip().lower(), Qt.CheckState.PartiallyChecked
         )
 
-    def _normalize_repo_entries(
-        self,
-        entries_payload: object,
-        entries_dir: Path,
-    ) -> list[_RepoEntry]:
-        normalized_entries: list[_RepoEntry] = []
-        if isinstance(entries_payload, Sequence) and not isinstance(
-            entries_payload, (str, bytes, bytearray)
-        ):
-            for entry in entries_payload:
-                if isinstance(entry, Mapping):
-                    normalized_entry = self._normalize_repo_entry(entry, entries_dir)
-                    if normalized_entry is not None:
-                        normalized_entries.append(normalized_entry)
-        return normalized_entries
-
-    @staticmethod
-    def _safe_stat(path: Path) -> os.stat_result | None:
-        try:
-            return path.stat()
-        except OSError:
-            return None
-
-    @staticmethod
-    def _read_json_payload(path: Path) -> dict[str, object] | None:
-        try:
-            raw_payload = cast("object", json.loads(path.read_text(encoding="utf-8")))
-        except (OSError, json.JSONDecodeError):
-            return None
-        if not isinstance(raw_payload, Mapping):
-            return None
-        mapping_payload = cast("Mapping[object, object]", raw_payload)
-        normalized_payload: dict[str, object] = {
-            str(key): value for key, value in mapping_payload.items()
-        }
-        return normalized_payload
-
-    def _load_repo_index_payload(
-        self,
-        stage_id: str,
-        metadata: Mapping[str, object] | None,
-    ) -> _RepoIndexCacheEntry | None:
-        metadata_dict: dict[str, object]
-        if metadata is None:
-            metadata_dict = {}
-        else:
-            metadata_dict = {str(key): value for key, value in metadata.items()}
-        index_path_obj = metadata_dict.get("repo_progress_index_path")
-        if not index_path_obj:
-            return None
-        index_path = Path(str(index_path_obj))
-        stat_result = self._safe_stat(index_path)
-        if stat_result is None:
-            return None
-        cached = self._repo_index_cache.get(stage_id)
-        mtime: float | None = float(stat_result.st_mtime)
-        if cached is not None and cached.mtime == mtime:
-            return cached
-        payload = self._read_json_payload(index_path)
-        if payload is None:
-            return None
-        entries_dir = index_path.parent
-        if "entries_dir" in payload:
-            entries_dir_raw = payload["entries_dir"]
-            if isinstance(entries_dir_raw, str):
-                entries_dir_candidate = entries_dir_raw.strip()
-                if entries_dir_candidate:
-                    entries_dir = Path(entries_dir_candidate)
-        entries_payload: object = payload.get("entries", None)
-        entries = self._normalize_repo_entries(entries_payload, entries_dir)
-        return _RepoIndexCacheEntry(path=index_path, mtime=mtime, entries=entries)
-
-    def _prune_stale_repo_cache(self, observed_ids: set[str]) -> None:
-        stale_keys = [
-            stage_id
-            for stage_id in list(self._repo_index_cache)
-            if stage_id not in observed_ids
-        ]
-        for stage_id in stale_keys:
-            self._repo_index_cache.pop(stage_id, None)
-
 
 def run_progress_board(
     *,
     snapshot_path: Path,
-    stage_definitions: Sequence[tuple[str, str]],
+    stage_definitions: Iterable[tuple[str, str]],
     worker_done_event: threading.Event,
 ) -> None:
     """Display the progress board until the orchestrator worker finishes."""
@@ -477,6 +964,10 @@ def run_progress_board(
 
     app.exec()
 
+    # The board is a central widget, so window.close() never delivers a
+    # close event to it; close it explicitly to release the shared watcher.
+    board.close()
+
     if created_app:
         app.deleteLater()
         QtWidgets.QApplication.processEvents()
@@ -88,3 +88,58 @@ def test_cli_main_invokes_progress_board(
     assert observed["stage_definitions"] == [("env", "Environment")]
     event = cast("threading.Event", observed["event"])
     assert event.is_set()
+
+
+def _run_cli_capturing_definitions(
+    monkeypatch: pytest.MonkeyPatch, snapshot_path: Path
+) -> list[tuple[str, str]]:
+    observed: dict[str, object] = {}
+
+    def fake_run_progress_board(
+        *,
+        snapshot_path: Path,
+        stage_definitions: Sequence[tuple[str, str]],
+        worker_done_event: threading.Event,
+    ) -> None:
+        observed["stage_definitions"] = list(stage_definitions)
+        worker_done_event.set()
+
+    monkeypatch.setattr(cli, "run_progress_board", fake_run_progress_board)
+    exit_code = cli.main(["--snapshot", str(snapshot_path)])
+    assert exit_code == 0
+    return cast("list[tuple[str, str]]", observed["stage_definitions"])
+
+
+def test_cli_main_missing_snapshot_uses_fallback(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    definitions = _run_cli_capturing_definitions(
+        monkeypatch, tmp_path / "missing.json"
+    )
+    assert definitions == [("environment", "Environment")]
+
+
+def test_cli_main_empty_snapshot_uses_fallback(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    snapshot_path = tmp_path / "snapshot.json"
+    snapshot_path.write_text(json.dumps({"stages": []}), encoding="utf-8")
+
+    definitions = _run_cli_capturing_definitions(monkeypatch, snapshot_path)
+    assert definitions == [("environment", "Environment")]
+
+
+def test_cli_main_blank_stage_ids_use_fallback(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    snapshot_path = tmp_path / "snapshot.json"
+    payload = {
+        "stages": [
+            {"id": "   ", "title": "Blank"},
+            {"id": "", "title": "Empty"},
+        ]
+    }
+    snapshot_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    definitions = _run_cli_capturing_definitions(monkeypatch, snapshot_path)
+    assert definitions == [("environment", "Environment")]
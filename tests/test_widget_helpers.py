@@ -0,0 +1,126 @@
+# ruff: noqa: S101,SLF001
+
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - typing helpers only
+    from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from x_make_progress_board_x import progress_board_widget
+
+
+def test_read_json_payload_returns_str_keyed_mapping(tmp_path: Path) -> None:
+    path = tmp_path / "payload.json"
+    path.write_text(json.dumps({"alpha": 1, "beta": [2, 3]}), encoding="utf-8")
+
+    payload = progress_board_widget._read_json_payload(path)
+    assert payload == {"alpha": 1, "beta": [2, 3]}
+
+
+def test_read_json_payload_rejects_non_mapping(tmp_path: Path) -> None:
+    path = tmp_path / "payload.json"
+    path.write_text(json.dumps([1, 2, 3]), encoding="utf-8")
+
+    assert progress_board_widget._read_json_payload(path) is None
+
+
+def test_read_json_payload_rejects_invalid_json(tmp_path: Path) -> None:
+    path = tmp_path / "payload.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert progress_board_widget._read_json_payload(path) is None
+    assert progress_board_widget._read_json_payload(tmp_path / "missing.json") is None
+
+
+def test_scan_mtimes_ns_groups_by_parent(tmp_path: Path) -> None:
+    first_dir = tmp_path / "first"
+    second_dir = tmp_path / "second"
+    first_dir.mkdir()
+    second_dir.mkdir()
+    first = first_dir / "index.json"
+    second = second_dir / "index.json"
+    first.write_text("{}", encoding="utf-8")
+    second.write_text("{}", encoding="utf-8")
+    missing = first_dir / "missing.json"
+    orphan = tmp_path / "no-such-dir" / "index.json"
+
+    mtimes = progress_board_widget._scan_mtimes_ns([first, second, missing, orphan])
+
+    assert mtimes == {
+        os.fspath(first): first.stat().st_mtime_ns,
+        os.fspath(second): second.stat().st_mtime_ns,
+    }
+
+
+def test_bounded_cache_store_evicts_oldest_entry() -> None:
+    cache: dict[int, int] = {}
+    limit = progress_board_widget._JSON_CACHE_MAX_ENTRIES
+    for key in range(limit):
+        progress_board_widget._bounded_cache_store(cache, key, key)
+    assert len(cache) == limit
+
+    progress_board_widget._bounded_cache_store(cache, limit, limit)
+    assert len(cache) == limit
+    assert 0 not in cache
+    assert cache[limit] == limit
+
+
+def test_cached_json_reuses_payload_per_mtime(tmp_path: Path) -> None:
+    worker = progress_board_widget._SnapshotLoaderWorker(tmp_path / "snapshot.json")
+    path = tmp_path / "index.json"
+    path.write_text(json.dumps({"value": 1}), encoding="utf-8")
+
+    first = worker._cached_json(str(path), 1)
+    assert first == {"value": 1}
+    path.write_text(json.dumps({"value": 2}), encoding="utf-8")
+    assert worker._cached_json(str(path), 1) is first
+    assert worker._cached_json(str(path), 2) == {"value": 2}
+
+
+def test_streamed_repo_index_joins_entries_dir_after_entries(tmp_path: Path) -> None:
+    pytest.importorskip("ijson")
+    worker = progress_board_widget._SnapshotLoaderWorker(tmp_path / "snapshot.json")
+    entries_dir = tmp_path / "details"
+    entries_dir.mkdir()
+    index_path = tmp_path / "index.json"
+    payload = {
+        "entries": [
+            {
+                "repo_id": "alpha",
+                "display_name": "Alpha",
+                "status": "completed",
+                "updated_at": "2026-08-28T00:00:00Z",
+                "message_preview": ["done"],
+                "detail_path": "alpha.json",
+            }
+        ],
+        "entries_dir": str(entries_dir),
+    }
+    index_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    entries = worker._normalize_streamed_repo_index(index_path)
+    assert entries is not None
+    assert len(entries) == 1
+    entry = entries[0]
+    assert entry.repo_id == "alpha"
+    assert entry.messages == ("done",)
+    expected = os.path.normpath(
+        os.path.join(str(entries_dir.resolve()), "alpha.json")
+    )
+    assert entry.detail_path == expected
+
+
+def test_streamed_repo_index_rejects_non_mapping(tmp_path: Path) -> None:
+    pytest.importorskip("ijson")
+    worker = progress_board_widget._SnapshotLoaderWorker(tmp_path / "snapshot.json")
+    index_path = tmp_path / "index.json"
+    index_path.write_text(json.dumps([1, 2, 3]), encoding="utf-8")
+
+    assert worker._normalize_streamed_repo_index(index_path) is None